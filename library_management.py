@@ -3,13 +3,28 @@ Library Management System - Python OOP Demonstration
 Demonstrating inheritance, polymorphism, and data management skills
 """
 
+import collections
+import heapq
+import itertools
 import json
 import datetime
-from abc import ABC, abstractmethod
+import operator
+import time
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Optional
 from enum import Enum
 
+try:
+    # orjson serializes in C (and handles datetimes natively), which is
+    # several times faster than the stdlib json module on large catalogs
+    import orjson
+except ImportError:
+    orjson = None
+
+def _now_epoch() -> float:
+    """Current time as a Unix timestamp, cheaper than building a datetime"""
+    return time.time()
+
 class ItemStatus(Enum):
     AVAILABLE = "Available"
     CHECKED_OUT = "Checked Out"
@@ -23,7 +38,7 @@ class NotificationType(Enum):
     FINE = "Fine Applied"
     GENERAL = "General"
 
-@dataclass
+@dataclass(slots=True)
 class Notification:
     notification_id: int
     user_id: int
@@ -32,23 +47,35 @@ class Notification:
     timestamp: datetime.datetime
     is_read: bool = False
 
-class Person(ABC):
-    """Abstract base class for all library persons"""
+class Person:
+    """Base class for all library persons (subclasses implement display_info)"""
+    __slots__ = ('person_id', 'name', 'email', 'join_date')
+
     def __init__(self, person_id: int, name: str, email: str):
         self.person_id = person_id
         self.name = name
         self.email = email
         self.join_date = datetime.datetime.now()
-        
-    @abstractmethod
+
     def display_info(self) -> str:
-        pass
+        raise NotImplementedError
 
 class Patron(Person):
     """Library patron/user class"""
+    __slots__ = ('membership_level', '_max_checkouts', 'checked_out_items',
+                 'reserved_items', 'fines', 'borrowing_history', 'notifications')
+
+    _MAX_CHECKOUTS = {
+        "Standard": 5,
+        "Premium": 10,
+        "Student": 3,
+        "Faculty": 15
+    }
+
     def __init__(self, patron_id: int, name: str, email: str, membership_level: str = "Standard"):
         super().__init__(patron_id, name, email)
         self.membership_level = membership_level
+        self._max_checkouts = Patron._MAX_CHECKOUTS.get(membership_level, 5)
         self.checked_out_items = []
         self.reserved_items = []
         self.fines = 0.0
@@ -59,25 +86,20 @@ class Patron(Person):
         return f"Patron: {self.name} (ID: {self.person_id}) - Membership: {self.membership_level}"
     
     def checkout_item(self, item) -> bool:
-        if len(self.checked_out_items) < self.get_max_checkouts():
+        if len(self.checked_out_items) < self._max_checkouts:
+            now = datetime.datetime.now()
             self.checked_out_items.append(item)
             self.borrowing_history.append({
                 'item_id': item.item_id,
                 'title': item.title,
-                'checkout_date': datetime.datetime.now(),
-                'due_date': datetime.datetime.now() + datetime.timedelta(days=item.checkout_period)
+                'checkout_date': now,
+                'due_date': now + datetime.timedelta(days=item.checkout_period)
             })
             return True
         return False
     
     def get_max_checkouts(self) -> int:
-        limits = {
-            "Standard": 5,
-            "Premium": 10,
-            "Student": 3,
-            "Faculty": 15
-        }
-        return limits.get(self.membership_level, 5)
+        return self._max_checkouts
     
     def add_notification(self, message: str, notification_type: NotificationType):
         notification = Notification(
@@ -92,14 +114,27 @@ class Patron(Person):
 
 class Librarian(Person):
     """Library staff member class"""
+    __slots__ = ('department', 'employee_id', 'permissions')
+
+    # Shared by all librarians; frozenset gives O(1) membership checks
+    # without allocating a fresh list per instance
+    _DEFAULT_PERMISSIONS = frozenset({"check_in", "check_out",
+                                      "manage_catalog", "process_fines"})
+
     def __init__(self, staff_id: int, name: str, email: str, department: str):
         super().__init__(staff_id, name, email)
         self.department = department
         self.employee_id = f"LIB{staff_id:04d}"
-        self.permissions = ["check_in", "check_out", "manage_catalog", "process_fines"]
-        
+        self.permissions = Librarian._DEFAULT_PERMISSIONS
+
     def display_info(self) -> str:
         return f"Librarian: {self.name} - Department: {self.department} (ID: {self.employee_id})"
+
+    def grant(self, permission: str):
+        """Grant an extra permission, copying the shared set on first write"""
+        if isinstance(self.permissions, frozenset):
+            self.permissions = set(self.permissions)
+        self.permissions.add(permission)
     
     def process_checkout(self, patron: Patron, item) -> bool:
         if patron.checkout_item(item):
@@ -109,6 +144,11 @@ class Librarian(Person):
     
     def process_checkin(self, item, condition: str = "Good") -> float:
         fine = item.checkin(condition)
+        # Emit reservation notices queued during checkin
+        for patron_id in item.pending_notifications:
+            # In a real system, you would notify the patron
+            print(f"Item {item.item_id} is now available for {patron_id}")
+        item.pending_notifications.clear()
         return fine
     
     def add_item_to_catalog(self, catalog, item) -> bool:
@@ -123,88 +163,139 @@ class Librarian(Person):
             return catalog.get_overdue_items_report()
         return {}
 
-class LibraryItem(ABC):
-    """Abstract base class for all library items"""
+class LibraryItem:
+    """Base class for all library items (subclasses define period and fine)"""
+    __slots__ = ('item_id', 'title', 'category', 'status', '_status_str',
+                 'checkout_count',
+                 'checkout_history', 'current_patron', 'due_date_epoch',
+                 'reservation_queue', '_reservation_set',
+                 'pending_notifications', 'added_date', '_catalog',
+                 '_info_cache')
+
     def __init__(self, item_id: int, title: str, category: str):
         self.item_id = item_id
         self.title = title
         self.category = category
+        self._catalog = None  # Set by Catalog.add_item; read by the setters below
         self.status = ItemStatus.AVAILABLE
+        self._status_str = ItemStatus.AVAILABLE.value  # cached for reports
         self.checkout_count = 0
         self.checkout_history = []
         self.current_patron = None
         self.due_date = None
-        self.reservation_queue = []
+        self.reservation_queue = collections.deque()
+        self._reservation_set = set()  # O(1) membership alongside the queue
+        self.pending_notifications = []  # patron ids awaiting availability notice
         self.added_date = datetime.datetime.now()
-        
-    @abstractmethod
+        self._info_cache = None  # get_item_info dict; None means stale
+
     def get_checkout_period(self) -> int:
         """Return checkout period in days"""
-        pass
-    
-    @abstractmethod
+        raise NotImplementedError
+
     def calculate_fine(self, days_overdue: int) -> float:
         """Calculate fine for overdue item"""
-        pass
+        raise NotImplementedError
     
     @property
     def checkout_period(self) -> int:
         return self.get_checkout_period()
-    
+
+    @property
+    def due_date(self) -> Optional[datetime.datetime]:
+        """Due date as a datetime; stored internally as a Unix timestamp so
+        overdue comparisons stay cheap float operations"""
+        if self.due_date_epoch is None:
+            return None
+        return datetime.datetime.fromtimestamp(self.due_date_epoch)
+
+    @due_date.setter
+    def due_date(self, value: Optional[datetime.datetime]):
+        self.due_date_epoch = value.timestamp() if value is not None else None
+        self._info_cache = None
+        # Keep the owning catalog's due-date heap in sync even when the
+        # due date is assigned directly, mirroring _set_status
+        if self._catalog is not None:
+            self._catalog._untrack_due_date(self.item_id)
+            if self.due_date_epoch is not None:
+                self._catalog._track_due_date(self)
+
+    def _set_status(self, new_status: ItemStatus):
+        """Change status, keeping the owning catalog's counts in sync"""
+        if self._catalog is not None:
+            self._catalog._status_counts[self.status] -= 1
+            self._catalog._status_counts[new_status] += 1
+        self.status = new_status
+        self._status_str = new_status.value
+        self._info_cache = None
+
     def checkout(self, patron_id: int) -> bool:
         if self.status == ItemStatus.AVAILABLE:
-            self.status = ItemStatus.CHECKED_OUT
+            now = datetime.datetime.now()
+            self._set_status(ItemStatus.CHECKED_OUT)
             self.current_patron = patron_id
             self.checkout_count += 1
-            self.due_date = datetime.datetime.now() + datetime.timedelta(days=self.checkout_period)
+            if self._catalog is not None:
+                self._catalog._total_checkouts += 1
+            self.due_date = now + datetime.timedelta(days=self.checkout_period)
             self.checkout_history.append({
                 'patron_id': patron_id,
-                'checkout_date': datetime.datetime.now(),
+                'checkout_date': now,
                 'due_date': self.due_date
             })
             return True
         return False
     
     def checkin(self, condition: str = "Good") -> float:
-        self.status = ItemStatus.AVAILABLE
+        self._set_status(ItemStatus.AVAILABLE)
         fine = 0.0
-        
-        if self.due_date and datetime.datetime.now() > self.due_date:
-            days_overdue = (datetime.datetime.now() - self.due_date).days
+        now_epoch = _now_epoch()
+
+        if self.due_date_epoch is not None and now_epoch > self.due_date_epoch:
+            days_overdue = int((now_epoch - self.due_date_epoch) // 86400)
             fine = self.calculate_fine(days_overdue)
-        
+
         self.current_patron = None
         self.due_date = None
         
-        # Process next reservation if any
+        # Queue the next reservation; the caller notifies out-of-band so
+        # checkin itself does no I/O
         if self.reservation_queue:
-            next_patron = self.reservation_queue.pop(0)
-            # In a real system, you would notify the patron
-            print(f"Item {self.item_id} is now available for {next_patron}")
-        
+            next_patron = self.reservation_queue.popleft()
+            self._reservation_set.discard(next_patron)
+            self.pending_notifications.append(next_patron)
+
         return fine
     
     def reserve(self, patron_id: int) -> bool:
-        if patron_id not in self.reservation_queue:
+        if patron_id not in self._reservation_set:
             self.reservation_queue.append(patron_id)
+            self._reservation_set.add(patron_id)
+            self._info_cache = None
             return True
         return False
     
     def get_item_info(self) -> Dict:
-        return {
-            'item_id': self.item_id,
-            'title': self.title,
-            'category': self.category,
-            'status': self.status.value,
-            'checkout_count': self.checkout_count,
-            'current_patron': self.current_patron,
-            'due_date': self.due_date.isoformat() if self.due_date else None,
-            'reservation_count': len(self.reservation_queue)
-        }
+        # Rebuilt only after a mutation; callers treat the dict as read-only
+        if self._info_cache is None:
+            self._info_cache = {
+                'item_id': self.item_id,
+                'title': self.title,
+                'category': self.category,
+                'status': self._status_str,
+                'checkout_count': self.checkout_count,
+                'current_patron': self.current_patron,
+                'due_date': self.due_date.isoformat() if self.due_date else None,
+                'reservation_count': len(self.reservation_queue)
+            }
+        return self._info_cache
 
 class Book(LibraryItem):
     """Book item class"""
-    def __init__(self, item_id: int, title: str, author: str, isbn: str, 
+    __slots__ = ('author', 'isbn', 'edition', 'page_count', 'publisher',
+                 'publication_year')
+
+    def __init__(self, item_id: int, title: str, author: str, isbn: str,
                  category: str = "General", edition: int = 1):
         super().__init__(item_id, title, category)
         self.author = author
@@ -214,25 +305,35 @@ class Book(LibraryItem):
         self.publisher = ""
         self.publication_year = datetime.datetime.now().year
         
+    _TYPE_NAME = 'Book'  # cached so reports skip the type(x).__name__ call
+    CHECKOUT_PERIOD_DAYS = 21  # 3 weeks for books
+    FINE_RATE = 0.25  # $0.25 per day
+
     def get_checkout_period(self) -> int:
-        return 21  # 3 weeks for books
-    
+        return self.CHECKOUT_PERIOD_DAYS
+
     def calculate_fine(self, days_overdue: int) -> float:
-        return days_overdue * 0.25  # $0.25 per day
+        return days_overdue * self.FINE_RATE
     
     def get_book_info(self) -> Dict:
-        info = self.get_item_info()
-        info.update({
+        # Merge-unpack builds the combined dict in one C-level operation
+        return {
+            **self.get_item_info(),
             'author': self.author,
             'isbn': self.isbn,
             'edition': self.edition,
             'type': 'Book'
-        })
-        return info
+        }
+
+    def to_dict(self) -> Dict:
+        """Serializable representation including type-specific fields"""
+        return self.get_book_info()
 
 class DVD(LibraryItem):
     """DVD item class"""
-    def __init__(self, item_id: int, title: str, director: str, 
+    __slots__ = ('director', 'runtime', 'format', 'rating', 'release_year')
+
+    def __init__(self, item_id: int, title: str, director: str,
                  category: str = "Entertainment", runtime: int = 0):
         super().__init__(item_id, title, category)
         self.director = director
@@ -241,26 +342,35 @@ class DVD(LibraryItem):
         self.rating = "NR"
         self.release_year = datetime.datetime.now().year
         
+    _TYPE_NAME = 'DVD'
+    CHECKOUT_PERIOD_DAYS = 7  # 1 week for DVDs
+    FINE_RATE = 1.00  # $1.00 per day
+
     def get_checkout_period(self) -> int:
-        return 7  # 1 week for DVDs
-    
+        return self.CHECKOUT_PERIOD_DAYS
+
     def calculate_fine(self, days_overdue: int) -> float:
-        return days_overdue * 1.00  # $1.00 per day
+        return days_overdue * self.FINE_RATE
     
     def get_dvd_info(self) -> Dict:
-        info = self.get_item_info()
-        info.update({
+        return {
+            **self.get_item_info(),
             'director': self.director,
             'runtime': self.runtime,
             'format': self.format,
             'rating': self.rating,
             'type': 'DVD'
-        })
-        return info
+        }
+
+    def to_dict(self) -> Dict:
+        """Serializable representation including type-specific fields"""
+        return self.get_dvd_info()
 
 class CD(Book):  # Inherits from Book since it shares many attributes
     """CD item class - demonstrates inheritance"""
-    def __init__(self, item_id: int, title: str, artist: str, 
+    __slots__ = ('artist', 'tracks', 'duration', 'format')
+
+    def __init__(self, item_id: int, title: str, artist: str,
                  category: str = "Music", tracks: int = 0):
         # Call Book's init but override author with artist
         super().__init__(item_id, title, artist, "", category)
@@ -269,22 +379,58 @@ class CD(Book):  # Inherits from Book since it shares many attributes
         self.duration = 0  # in minutes
         self.format = "CD"
         
+    _TYPE_NAME = 'CD'
+    CHECKOUT_PERIOD_DAYS = 14  # 2 weeks for CDs
+    FINE_RATE = 0.50  # $0.50 per day
+
     def get_checkout_period(self) -> int:
-        return 14  # 2 weeks for CDs
-    
+        return self.CHECKOUT_PERIOD_DAYS
+
     def calculate_fine(self, days_overdue: int) -> float:
-        return days_overdue * 0.50  # $0.50 per day
+        return days_overdue * self.FINE_RATE
     
     def get_cd_info(self) -> Dict:
-        info = self.get_item_info()
-        info.update({
+        return {
+            **self.get_item_info(),
             'artist': self.artist,
             'tracks': self.tracks,
             'duration': self.duration,
             'format': self.format,
             'type': 'CD'
-        })
-        return info
+        }
+
+    def to_dict(self) -> Dict:
+        """Serializable representation including type-specific fields"""
+        return self.get_cd_info()
+
+# Saved type name -> constructor, so load_from_file dispatches with one
+# dict lookup per row instead of an if/elif chain
+_ITEM_FACTORIES = {
+    'Book': lambda d: Book(
+        item_id=d['item_id'],
+        title=d['title'],
+        author=d.get('author', ''),
+        isbn=d.get('isbn', ''),
+        category=d.get('category', 'General')
+    ),
+    'DVD': lambda d: DVD(
+        item_id=d['item_id'],
+        title=d['title'],
+        director=d.get('director', ''),
+        category=d.get('category', 'Entertainment'),
+        runtime=d.get('runtime', 0)
+    ),
+    'CD': lambda d: CD(
+        item_id=d['item_id'],
+        title=d['title'],
+        artist=d.get('artist', ''),
+        category=d.get('category', 'Music'),
+        tracks=d.get('tracks', 0)
+    )
+}
+
+# Status value -> member, avoiding the Enum constructor per row
+_STATUS_BY_VALUE = {status.value: status for status in ItemStatus}
 
 class Catalog:
     """Main catalog management class"""
@@ -292,104 +438,186 @@ class Catalog:
         self.items = {}
         self.patrons = {}
         self.librarians = {}
-        self.next_item_id = 1
-        self.next_patron_id = 1
-        self.next_staff_id = 1
-        
+        self._status_counts = collections.Counter()
+        # Lowercased token -> set of item_ids, one inverted index per search field
+        self._search_indexes = {
+            'title': collections.defaultdict(set),
+            'author': collections.defaultdict(set),
+            'category': collections.defaultdict(set)
+        }
+        # itertools.count increments at C level and is safe under threads
+        self._item_ids = itertools.count(1)
+        self._patron_ids = itertools.count(1)
+        self._staff_ids = itertools.count(1)
+        # Min-heap of (due_epoch, item_id, version) for checked-out items;
+        # stale entries are invalidated via _due_versions and dropped lazily.
+        # Versions come from a catalog-wide monotonic counter so a stale
+        # entry can never collide with a later push for the same item
+        self._due_heap = []
+        self._due_versions = {}
+        self._due_version_counter = itertools.count(1)
+        self._total_checkouts = 0
+
     def add_item(self, item: LibraryItem) -> bool:
         if item.item_id not in self.items:
             self.items[item.item_id] = item
+            item._catalog = self
+            self._status_counts[item.status] += 1
+            self._total_checkouts += item.checkout_count
+            self._index_item(item)
+            if item.due_date_epoch is not None:
+                self._track_due_date(item)
             return True
         return False
-    
+
     def remove_item(self, item_id: int) -> bool:
         if item_id in self.items:
-            del self.items[item_id]
+            item = self.items.pop(item_id)
+            item._catalog = None
+            self._status_counts[item.status] -= 1
+            self._total_checkouts -= item.checkout_count
+            self._unindex_item(item)
+            self._untrack_due_date(item_id)
             return True
         return False
+
+    def _track_due_date(self, item: LibraryItem):
+        """Record a checked-out item's due date in the overdue heap"""
+        version = next(self._due_version_counter)
+        self._due_versions[item.item_id] = version
+        heapq.heappush(self._due_heap,
+                       (item.due_date_epoch, item.item_id, version))
+
+    def _untrack_due_date(self, item_id: int):
+        """Invalidate the item's heap entry; it is dropped on the next walk"""
+        self._due_versions.pop(item_id, None)
+
+    def _index_item(self, item: LibraryItem):
+        """Add an item's searchable text to the inverted indexes"""
+        for field, index in self._search_indexes.items():
+            value = getattr(item, field, None)
+            if value:
+                for token in value.lower().split():
+                    index[token].add(item.item_id)
+
+    def _unindex_item(self, item: LibraryItem):
+        """Remove an item's tokens from the inverted indexes"""
+        for field, index in self._search_indexes.items():
+            value = getattr(item, field, None)
+            if value:
+                for token in value.lower().split():
+                    index[token].discard(item.item_id)
+                    if not index[token]:
+                        del index[token]
     
     def search_items(self, search_term: str, search_by: str = "title") -> List[Dict]:
-        results = []
-        for item in self.items.values():
-            if search_by == "title" and search_term.lower() in item.title.lower():
-                results.append(item.get_item_info())
-            elif search_by == "author" and hasattr(item, 'author'):
-                if search_term.lower() in item.author.lower():
-                    results.append(item.get_item_info())
-            elif search_by == "category" and search_term.lower() in item.category.lower():
-                results.append(item.get_item_info())
-        return results
+        index = self._search_indexes.get(search_by)
+        if index is None:
+            return []
+
+        # Lowercase once, then intersect the id sets matched by each word.
+        # Scanning the (small) token vocabulary instead of every item keeps
+        # the original substring-match behavior without touching item objects.
+        matched_ids = None
+        for word in search_term.lower().split():
+            word_ids = set()
+            for token, ids in index.items():
+                if word in token:
+                    word_ids |= ids
+            matched_ids = word_ids if matched_ids is None else matched_ids & word_ids
+            if not matched_ids:
+                return []
+
+        if matched_ids is None:
+            matched_ids = self.items.keys()
+
+        return [self.items[item_id].get_item_info() for item_id in sorted(matched_ids)]
     
     def add_patron(self, name: str, email: str, membership_level: str = "Standard") -> Patron:
-        patron = Patron(self.next_patron_id, name, email, membership_level)
+        patron = Patron(next(self._patron_ids), name, email, membership_level)
         self.patrons[patron.person_id] = patron
-        self.next_patron_id += 1
         return patron
-    
+
     def add_librarian(self, name: str, email: str, department: str) -> Librarian:
-        librarian = Librarian(self.next_staff_id, name, email, department)
+        librarian = Librarian(next(self._staff_ids), name, email, department)
         self.librarians[librarian.person_id] = librarian
-        self.next_staff_id += 1
         return librarian
     
     def get_inventory_report(self) -> Dict:
-        report = {
+        # Status counts are maintained incrementally, so these are O(1) lookups
+        by_category = collections.Counter()
+        by_type = collections.Counter()
+
+        # Single pass for the per-category and per-type breakdowns
+        for item in self.items.values():
+            by_category[item.category] += 1
+            by_type[item._TYPE_NAME] += 1
+
+        return {
             'total_items': len(self.items),
-            'available_items': sum(1 for item in self.items.values() 
-                                 if item.status == ItemStatus.AVAILABLE),
-            'checked_out_items': sum(1 for item in self.items.values() 
-                                   if item.status == ItemStatus.CHECKED_OUT),
-            'by_category': {},
-            'by_type': {}
+            'available_items': self._status_counts[ItemStatus.AVAILABLE],
+            'checked_out_items': self._status_counts[ItemStatus.CHECKED_OUT],
+            'by_category': dict(by_category),
+            'by_type': dict(by_type)
         }
-        
-        for item in self.items.values():
-            # Count by category
-            report['by_category'][item.category] = report['by_category'].get(item.category, 0) + 1
-            
-            # Count by type
-            item_type = type(item).__name__
-            report['by_type'][item_type] = report['by_type'].get(item_type, 0) + 1
-        
-        return report
     
     def get_popular_items_report(self, limit: int = 10) -> Dict:
-        sorted_items = sorted(self.items.values(), 
-                            key=lambda x: x.checkout_count, 
-                            reverse=True)[:limit]
-        
+        # O(N log limit) top-k selection instead of sorting the whole catalog
+        top_items = heapq.nlargest(limit, self.items.values(),
+                                   key=operator.attrgetter('checkout_count'))
+
         return {
             'popular_items': [
                 {
                     'title': item.title,
                     'checkout_count': item.checkout_count,
-                    'type': type(item).__name__,
+                    'type': item._TYPE_NAME,
                     'category': item.category
                 }
-                for item in sorted_items
+                for item in top_items
             ],
-            'total_checkouts': sum(item.checkout_count for item in self.items.values())
+            'total_checkouts': self._total_checkouts
         }
     
     def get_overdue_items_report(self) -> Dict:
         overdue_items = []
         total_fines = 0.0
-        
-        for item in self.items.values():
-            if item.due_date and datetime.datetime.now() > item.due_date:
-                days_overdue = (datetime.datetime.now() - item.due_date).days
-                fine = item.calculate_fine(days_overdue)
-                
-                overdue_items.append({
-                    'item_id': item.item_id,
-                    'title': item.title,
-                    'due_date': item.due_date.isoformat(),
-                    'days_overdue': days_overdue,
-                    'estimated_fine': fine,
-                    'current_patron': item.current_patron
-                })
-                total_fines += fine
-        
+        now_epoch = _now_epoch()
+
+        # Walk the due-date heap in order and stop at the first entry that
+        # is not yet due, so work scales with the number of overdue items
+        # rather than the catalog size. Entries hold epoch floats, so the
+        # comparisons and day arithmetic are plain float operations; item
+        # objects and datetimes are only touched for actual overdue rows.
+        # Stale entries are discarded here.
+        popped = []
+        while self._due_heap:
+            due_epoch, item_id, version = self._due_heap[0]
+            if self._due_versions.get(item_id) != version:
+                heapq.heappop(self._due_heap)
+                continue
+            if due_epoch >= now_epoch:
+                break
+            popped.append(heapq.heappop(self._due_heap))
+
+            item = self.items[item_id]
+            days_overdue = int((now_epoch - due_epoch) // 86400)
+            fine = days_overdue * item.FINE_RATE
+
+            overdue_items.append({
+                'item_id': item.item_id,
+                'title': item.title,
+                'due_date': item.due_date.isoformat(),
+                'days_overdue': days_overdue,
+                'estimated_fine': fine,
+                'current_patron': item.current_patron
+            })
+            total_fines += fine
+
+        # Overdue items are still checked out, so their entries go back
+        for entry in popped:
+            heapq.heappush(self._due_heap, entry)
+
         return {
             'overdue_items': overdue_items,
             'total_items_overdue': len(overdue_items),
@@ -398,41 +626,33 @@ class Catalog:
     
     def save_to_file(self, filename: str = "library_data.json"):
         """Save catalog data to JSON file"""
+        # Pre-size the item list and assign by index to skip append growth
+        items_list = [None] * len(self.items)
+        for i, item in enumerate(self.items.values()):
+            items_list[i] = item.to_dict()
+
+        # Snapshot the allocators, then re-seed them so saving twice in a
+        # row does not burn ids
+        next_item = next(self._item_ids)
+        next_patron = next(self._patron_ids)
+        next_staff = next(self._staff_ids)
+        self._item_ids = itertools.count(next_item)
+        self._patron_ids = itertools.count(next_patron)
+        self._staff_ids = itertools.count(next_staff)
+
         data = {
-            'items': [],
+            # Each subclass knows its own payload, so no isinstance checks
+            # here (which also serialized CDs as Books, since CD is a Book)
+            'items': items_list,
             'patrons': [],
             'librarians': [],
             'next_ids': {
-                'item': self.next_item_id,
-                'patron': self.next_patron_id,
-                'staff': self.next_staff_id
+                'item': next_item,
+                'patron': next_patron,
+                'staff': next_staff
             }
         }
-        
-        for item in self.items.values():
-            item_data = item.get_item_info()
-            item_data['type'] = type(item).__name__
-            
-            # Add type-specific data
-            if isinstance(item, Book):
-                item_data.update({
-                    'author': item.author,
-                    'isbn': item.isbn,
-                    'edition': item.edition
-                })
-            elif isinstance(item, DVD):
-                item_data.update({
-                    'director': item.director,
-                    'runtime': item.runtime
-                })
-            elif isinstance(item, CD):
-                item_data.update({
-                    'artist': item.artist,
-                    'tracks': item.tracks
-                })
-            
-            data['items'].append(item_data)
-        
+
         for patron in self.patrons.values():
             data['patrons'].append({
                 'patron_id': patron.person_id,
@@ -442,8 +662,13 @@ class Catalog:
                 'fines': patron.fines
             })
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        # Compact output: the file is machine-consumed, so skip indenting
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, default=str))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, default=str)
         
         print(f"Data saved to {filename}")
         return True
@@ -451,54 +676,40 @@ class Catalog:
     def load_from_file(self, filename: str = "library_data.json"):
         """Load catalog data from JSON file"""
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(filename, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filename, 'r') as f:
+                    data = json.load(f)
             
-            # Clear current data
+            # Clear current data and the derived bookkeeping structures
             self.items.clear()
             self.patrons.clear()
+            self._status_counts.clear()
+            for index in self._search_indexes.values():
+                index.clear()
+            self._due_heap.clear()
+            self._due_versions.clear()
+            self._total_checkouts = 0
             
             # Load items
             for item_data in data.get('items', []):
-                item_type = item_data.pop('type', 'Book')
-                
-                if item_type == 'Book':
-                    item = Book(
-                        item_id=item_data['item_id'],
-                        title=item_data['title'],
-                        author=item_data.get('author', ''),
-                        isbn=item_data.get('isbn', ''),
-                        category=item_data.get('category', 'General')
-                    )
-                elif item_type == 'DVD':
-                    item = DVD(
-                        item_id=item_data['item_id'],
-                        title=item_data['title'],
-                        director=item_data.get('director', ''),
-                        category=item_data.get('category', 'Entertainment'),
-                        runtime=item_data.get('runtime', 0)
-                    )
-                elif item_type == 'CD':
-                    item = CD(
-                        item_id=item_data['item_id'],
-                        title=item_data['title'],
-                        artist=item_data.get('artist', ''),
-                        category=item_data.get('category', 'Music'),
-                        tracks=item_data.get('tracks', 0)
-                    )
-                else:
+                factory = _ITEM_FACTORIES.get(item_data.pop('type', 'Book'))
+                if factory is None:
                     continue
-                
+                item = factory(item_data)
+
                 # Restore item state
-                item.status = ItemStatus(item_data.get('status', 'Available'))
+                item._set_status(_STATUS_BY_VALUE[item_data.get('status', 'Available')])
                 item.checkout_count = item_data.get('checkout_count', 0)
-                self.items[item.item_id] = item
+                self.add_item(item)
             
-            # Load IDs
+            # Re-seed the ID allocators
             next_ids = data.get('next_ids', {})
-            self.next_item_id = next_ids.get('item', 1)
-            self.next_patron_id = next_ids.get('patron', 1)
-            self.next_staff_id = next_ids.get('staff', 1)
+            self._item_ids = itertools.count(next_ids.get('item', 1))
+            self._patron_ids = itertools.count(next_ids.get('patron', 1))
+            self._staff_ids = itertools.count(next_ids.get('staff', 1))
             
             print(f"Data loaded from {filename}")
             return True